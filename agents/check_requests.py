@@ -1,31 +1,74 @@
 import os
 import time
-import json
-import requests
+import asyncio
+import logging
+import aiohttp
+import orjson
 from web3 import Web3
+from web3._utils.abi import get_abi_output_types
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger("check_requests")
+
 NETWORKS = {
     "sonic": {
         "rpc": os.getenv("SONIC_RPC", "https://rpc.blaze.soniclabs.com"),
-        "contract_address": "0x5170DC48cb64F0DEe4Bd658Bf942F23E4f72f2Bf",
-        "abi_path": "./abi.json"
+        "contract_address": "0x5170DC48cb64F0DEe4Bd658Bf942F23E4f72f2Bf"
     },
     "monad": {
         "rpc": os.getenv("MONAD_RPC", "https://testnet-rpc.monad.xyz/"),
-        "contract_address": "0x0Ae3b3c65D1242EE40DcDD3f8440C2424abA3789",
-        "abi_path": "./abi.json"
+        "contract_address": "0x0Ae3b3c65D1242EE40DcDD3f8440C2424abA3789"
     }
 }
 
+# Canonical Multicall3 deployment (same address on most EVM chains)
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    }
+]
+
+# Both networks share one ABI file; parse it once at import
+with open("./abi.json", "rb") as f:
+    CONTRACT_ABI = orjson.loads(f.read())
+
+GET_REQUESTS_OUTPUT_TYPES = get_abi_output_types(next(
+    entry for entry in CONTRACT_ABI
+    if entry.get("type") == "function" and entry.get("name") == "getRequests"
+))
+
 contracts = {}
+multicalls = {}
 for network, config in NETWORKS.items():
     w3 = Web3(Web3.HTTPProvider(config["rpc"]))
-    with open(config["abi_path"], "r") as f:
-        abi = json.load(f)
-    contracts[network] = w3.eth.contract(address=config["contract_address"], abi=abi)
+    contracts[network] = w3.eth.contract(address=config["contract_address"], abi=CONTRACT_ABI)
+    multicalls[network] = w3.eth.contract(address=MULTICALL3, abi=MULTICALL3_ABI)
 
 EMAILJS_SERVICE_ID = os.getenv("EMAILJS_SERVICE_ID", "dewill")
 EMAILJS_TEMPLATE_ID = os.getenv("EMAILJS_TEMPLATE_ID", "dewill_template")
@@ -33,7 +76,39 @@ EMAILJS_PUBLIC_KEY = os.getenv("EMAILJS_PUBLIC_KEY")
 EMAILJS_PRIVATE_KEY = os.getenv("EMAILJS_PRIVATE_KEY")
 EMAILJS_API_URL = "https://api.emailjs.com/api/v1.0/email/send"
 
-def send_email(to_email, to_name, percentage, code, network):
+# Requests that already triggered a notification; contract state is
+# re-fetched every scan, so skip rows we have handled in this process.
+# Keys are added only after a successful send, so failures retry on the
+# next scan instead of being dropped for the process lifetime.
+processed = set()
+
+POLL_INTERVAL = 12    # roughly one block on the target testnets
+RESYNC_INTERVAL = 600  # safety net: full rescan even without new logs
+
+last_scanned_block = {}
+
+def has_new_logs(network, contract):
+    """Cheap probe: did the contract emit any logs since the last scan?"""
+    try:
+        w3 = contract.w3
+        latest = w3.eth.block_number
+        last = last_scanned_block.get(network)
+        last_scanned_block[network] = latest
+        if last is None:
+            return True  # first pass, scan everything
+        if latest <= last:
+            return False
+        logs = w3.eth.get_logs({
+            "address": contract.address,
+            "fromBlock": last + 1,
+            "toBlock": latest
+        })
+        return bool(logs)
+    except Exception as e:
+        print(f"Log probe failed for {network}, falling back to full scan: {e}")
+        return True
+
+async def send_email(session, key, to_email, to_name, percentage, code, network):
     message = (
         f"Dear {to_name},\n\n"
         f"Your {percentage}% of funds from the {network.capitalize()} network are now available! "
@@ -53,38 +128,98 @@ def send_email(to_email, to_name, percentage, code, network):
         }
     }
     headers = {"Content-Type": "application/json"}
-    response = requests.post(EMAILJS_API_URL, json=payload, headers=headers)
-    if response.status_code == 200:
-        print(f"Email sent to {to_email} for {network}")
-    else:
-        print(f"Email failed for {network}: {response.status_code} - {response.text}")
+    async with session.post(EMAILJS_API_URL, data=orjson.dumps(payload), headers=headers) as response:
+        body = await response.text()
+        if response.status == 200:
+            processed.add(key)
+            print(f"Email sent to {to_email} for {network}")
+        else:
+            print(f"Email failed for {network}: {response.status} - {body}")
+
+def get_requests_multicall(network, contract, wallets):
+    """Fetch getRequests(wallet) for every wallet in a single Multicall3 eth_call."""
+    calls = [
+        (contract.address, True, contract.encodeABI(fn_name="getRequests", args=[wallet]))
+        for wallet in wallets
+    ]
+    returns = multicalls[network].functions.aggregate3(calls).call()
+
+    decoded = {}
+    codec = contract.w3.codec
+    for wallet, (success, return_data) in zip(wallets, returns):
+        if not success or not return_data:
+            continue
+        decoded[wallet] = codec.decode(GET_REQUESTS_OUTPUT_TYPES, return_data)[0]
+    return decoded
+
+def scan_network(network, contract, current_time):
+    """Scan one network's contract and return the email jobs now due."""
+    wallets = contract.functions.getKeys().call()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: scanning %d wallets", network, len(wallets))
+
+    jobs = []
+    requests_by_wallet = get_requests_multicall(network, contract, wallets)
+    for wallet, requests in requests_by_wallet.items():
+        for req in requests:
+            # Only unpack rows that are actually due
+            if req[4] > current_time:
+                continue
+            email, code, percentage, reason, timestamp = req
+            key = (network, wallet, code)
+            if key in processed:
+                continue
+            to_name = code.partition("_")[2] or "Recipient"
+            jobs.append((key, email, to_name, percentage, code, network))
+    return jobs
 
-def check_requests():
+async def check_requests(session, networks=None):
     try:
         current_time = int(time.time())
 
-        for network, contract in contracts.items():
-            wallets = contract.functions.getKeys().call()
-            print(wallets)
-
-            for wallet in wallets:
-                requests = contract.functions.getRequests(wallet).call()
-                print(requests)
-                for req in requests:
-                    print(req)
-                    email, code, percentage, reason, timestamp = req
-                    print(email)
-                    print(code)
-                    if timestamp <= current_time:
-                        print(timestamp)
-                        print(current_time)
-                        to_name = code.split("_")[1] if "_" in code else "Recipient"
-                        print("success")
+        # Each network has its own Web3 instance, so the blocking RPC
+        # scans can safely run on separate threads in parallel
+        scans = await asyncio.gather(*(
+            asyncio.to_thread(scan_network, network, contracts[network], current_time)
+            for network in (networks if networks is not None else contracts)
+        ))
+
+        jobs = [job for scan in scans for job in scan]
+        if jobs:
+            results = await asyncio.gather(
+                *(send_email(session, *job) for job in jobs),
+                return_exceptions=True
+            )
+            # One failed send must not cancel the rest, but it still has
+            # to be visible; the key stays out of processed so it retries
+            for job, result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    print(f"Email send failed for {job[0]}: {result}")
 
     except Exception as e:
         print(f"Error checking requests: {e}")
 
+async def main():
+    # One session for the whole process: keep-alive + TLS session reuse
+    # saves the ~2-RTT handshake per EmailJS send
+    connector = aiohttp.TCPConnector(
+        limit=50,
+        limit_per_host=20,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    )
+    last_resync = 0.0
+    async with aiohttp.ClientSession(connector=connector) as session:
+        while True:
+            if time.monotonic() - last_resync >= RESYNC_INTERVAL:
+                due = list(contracts)
+                last_resync = time.monotonic()
+            else:
+                due = [n for n, c in contracts.items() if has_new_logs(n, c)]
+
+            if due:
+                await check_requests(session, due)
+            await asyncio.sleep(POLL_INTERVAL)
+
 if __name__ == "__main__":
-    while True:
-        check_requests()
-        time.sleep(60)
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
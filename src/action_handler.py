@@ -2,7 +2,7 @@ import logging
 
 logger = logging.getLogger("action_handler")
 
-action_registry = {}    
+action_registry = {}
 
 def register_action(action_name):
     def decorator(func):
@@ -10,11 +10,13 @@ def register_action(action_name):
         return func
     return decorator
 
-def execute_action(agent, action_name, **kwargs):
-    if action_name in action_registry:
-       return action_registry[action_name](agent, **kwargs)
-    else:
-        logger.error(f"Action {action_name} not found")
-        return None
-    
+# Bound once so hot dispatch skips the attribute fetch
+registry_get = action_registry.get
 
+def execute_action(agent, action_name, **kwargs):
+    fn = registry_get(action_name)
+    if fn is not None:
+        logger.debug("Executing action %s", action_name)
+        return fn(agent, **kwargs)
+    logger.error("Action %s not found", action_name)
+    return None
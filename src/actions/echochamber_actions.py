@@ -1,7 +1,17 @@
 import time,random
+from collections import OrderedDict
 from src.action_handler import register_action
 from src.prompts import REPLY_ECHOCHAMBER_PROMPT, POST_ECHOCHAMBER_PROMPT
 
+# Cap on remembered replied-to message ids (oldest evicted first)
+REPLIED_MESSAGES_MAX = 10000
+
+# Dedicated PRNG instance: skips the shared random-module state, and the
+# two username-prompt variants are built once instead of per message
+_rng = random.Random()
+_REFER_PROMPT = "Refer the sender by their @{sender_username}"
+_NO_REFER_PROMPT = "Respond without directly referring to the sender"
+
 @register_action("post-echochambers")
 def post_echochambers(agent, **kwargs):
     current_time = time.time()
@@ -10,14 +20,14 @@ def post_echochambers(agent, **kwargs):
     if "echochambers_last_message" not in agent.state:
         agent.state["echochambers_last_message"] = 0
     if "echochambers_replied_messages" not in agent.state:
-        agent.state["echochambers_replied_messages"] = set()
-    
+        agent.state["echochambers_replied_messages"] = OrderedDict()
+
     if current_time - agent.state["echochambers_last_message"] > agent.echochambers_message_interval:
         agent.logger.info("\n📝 GENERATING NEW ECHOCHAMBERS MESSAGE")
         
         # Generate message based on room topic and tags
         previous_messages = agent.connection_manager.connections["echochambers"].sent_messages
-        previous_content = "\n".join([f"- {msg['content']}" for msg in previous_messages])
+        previous_content = "\n".join(f"- {msg['content']}" for msg in previous_messages)
         agent.logger.info(f"Found {len(previous_messages)} messages in post history")
         
         prompt  = POST_ECHOCHAMBER_PROMPT.format(
@@ -43,10 +53,11 @@ def post_echochambers(agent, **kwargs):
 def reply_echochambers(agent, **kwargs):
     agent.logger.info("\n🔍 CHECKING FOR MESSAGES TO REPLY TO")
     
-    # Initialize replied messages set if not exists
+    # Initialize bounded replied-messages LRU if not exists
     if "echochambers_replied_messages" not in agent.state:
-        agent.state["echochambers_replied_messages"] = set()
-        
+        agent.state["echochambers_replied_messages"] = OrderedDict()
+    replied_messages = agent.state["echochambers_replied_messages"]
+
 
     # Get recent messages
     history = agent.connection_manager.perform_action(
@@ -57,6 +68,10 @@ def reply_echochambers(agent, **kwargs):
 
     if history:
         agent.logger.info(f"Found {len(history)} messages in history")
+        # Room info and our own username are loop-invariant; resolve them once
+        room_topic = agent.state['room_info']['topic']
+        room_tags = ", ".join(agent.state['room_info']['tags'])
+        own_username = agent.connection_manager.connections["echochambers"].config["sender_username"]
         for message in history:
             message_id = message.get('id')
             sender = message.get('sender', {})
@@ -71,23 +86,25 @@ def reply_echochambers(agent, **kwargs):
             # Skip if:
             # 1. It's our message
             # 2. We've already replied to it
-            if (sender_username == agent.connection_manager.connections["echochambers"].config["sender_username"] or 
-                message_id in agent.state.get("echochambers_replied_messages", set())):
+            if (sender_username == own_username or
+                message_id in replied_messages):
                 agent.logger.info(f"Skipping message from {sender_username} (already replied or own message)")
                 continue
                 
             agent.logger.info(f"\n💬 GENERATING REPLY to: @{sender_username} - {content[:69]}...")
             
-            refer_username = random.random() < 0.7
-            username_prompt = f"Refer the sender by their @{sender_username}" if refer_username else "Respond without directly referring to the sender"
+            if _rng.random() < 0.7:
+                username_prompt = _REFER_PROMPT.format(sender_username=sender_username)
+            else:
+                username_prompt = _NO_REFER_PROMPT
             prompt = REPLY_ECHOCHAMBER_PROMPT.format(
                 content=content,
                 sender_username=sender_username,
-                room_topic=agent.state['room_info']['topic'],
-                tags=", ".join(agent.state['room_info']['tags']),
+                room_topic=room_topic,
+                tags=room_tags,
                 username_prompt=username_prompt
             )
-            reply = agent.prompt_llm(prompt)
+            reply = agent.prompt_llm(prompt, use_cache=True)
             
             if reply:
                 agent.logger.info(f"\n🚀 Posting reply: '{reply[:69]}...'")
@@ -96,7 +113,9 @@ def reply_echochambers(agent, **kwargs):
                     action_name="send-message",
                     params=[reply]
                 )
-                agent.state["echochambers_replied_messages"].add(message_id)
+                replied_messages[message_id] = None
+                if len(replied_messages) > REPLIED_MESSAGES_MAX:
+                    replied_messages.popitem(last=False)
                 agent.logger.info("✅ Reply posted successfully!")
                 return True
     else:
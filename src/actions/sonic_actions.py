@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from src.action_handler import register_action
 
@@ -55,6 +56,35 @@ def get_sonic_balance(agent, **kwargs):
         logger.error(f"Failed to get balance: {str(e)}")
         return None
 
+@register_action("get-sonic-balances")
+def get_sonic_balances(agent, **kwargs):
+    """Get $S or token balances for several addresses in one action.
+    Reads are dispatched concurrently so N RPC round trips overlap
+    instead of serializing one per address.
+    """
+    try:
+        addresses = kwargs.get("addresses")
+        token_address = kwargs.get("token_address")
+
+        if not addresses:
+            logger.error("No addresses provided")
+            return None
+
+        connection = agent.connection_manager.connections["sonic"]
+        with ThreadPoolExecutor(max_workers=min(len(addresses), 10)) as executor:
+            balances = list(executor.map(
+                lambda address: connection.get_balance(
+                    address=address,
+                    token_address=token_address
+                ),
+                addresses
+            ))
+        return balances
+
+    except Exception as e:
+        logger.error(f"Failed to get balances: {str(e)}")
+        return None
+
 @register_action("send-sonic")
 def send_sonic(agent, **kwargs):
     """Send $S tokens to an address.
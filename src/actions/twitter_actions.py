@@ -1,34 +1,36 @@
 import time,threading
+from concurrent.futures import ThreadPoolExecutor
 from src.action_handler import register_action
 from src.helpers import print_h_bar
-from src.prompts import POST_TWEET_PROMPT, REPLY_TWEET_PROMPT
+from src.prompts import REPLY_TWEET_PROMPT
+
+# Max tweets processed per batched action; also bounds the worker pool
+# so we stay inside Twitter rate limits while overlapping LLM + API calls
+TWEET_BATCH_SIZE = 5
 
 
 @register_action("post-tweet")
 def post_tweet(agent, **kwargs):
     current_time = time.time()
 
-    if ("last_tweet_time" not in agent.state):
-        last_tweet_time = 0
-    else:
-        last_tweet_time = agent.state["last_tweet_time"]
+    last_tweet_time = agent.state.get("last_tweet_time", 0)
 
     if current_time - last_tweet_time >= agent.tweet_interval:
         agent.logger.info("\n📝 GENERATING NEW TWEET")
         print_h_bar()
 
-        prompt = POST_TWEET_PROMPT.format(agent_name = agent.name)
-        tweet_text = agent.prompt_llm(prompt)
+        tweet_text = agent.prompt_llm(agent.post_tweet_prompt)
 
         if tweet_text:
             agent.logger.info("\n🚀 Posting tweet:")
-            agent.logger.info(f"'{tweet_text}'")
+            agent.logger.info("'%s'", tweet_text)
             agent.connection_manager.perform_action(
                 connection_name="twitter",
                 action_name="post-tweet",
                 params=[tweet_text]
             )
             agent.state["last_tweet_time"] = current_time
+            agent._timeline_cache = None  # our own post changes the timeline
             agent.logger.info("\n✅ Tweet posted successfully!")
             return True
     else:
@@ -36,53 +38,65 @@ def post_tweet(agent, **kwargs):
         return False
 
 
-@register_action("reply-to-tweet")
-def reply_to_tweet(agent, **kwargs):
-    if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
-        tweet = agent.state["timeline_tweets"].pop(0)
-        tweet_id = tweet.get('id')
-        if not tweet_id:
-            return
+def _reply_to_one(agent, tweet):
+    """Generate and post a reply for a single timeline tweet"""
+    tweet_id = tweet.get('id')
+    if not tweet_id:
+        return False
 
-        agent.logger.info(f"\n💬 GENERATING REPLY to: {tweet.get('text', '')[:50]}...")
+    agent.logger.info("\n💬 GENERATING REPLY to: %s...", tweet.get('text', '')[:50])
 
-        base_prompt = REPLY_TWEET_PROMPT.format(tweet_text =tweet.get('text') )
-        system_prompt = agent._construct_system_prompt()
-        reply_text = agent.prompt_llm(prompt=base_prompt, system_prompt=system_prompt)
+    base_prompt = REPLY_TWEET_PROMPT.format(tweet_text =tweet.get('text') )
+    reply_text = agent.prompt_llm(prompt=base_prompt, use_cache=True)
 
-        if reply_text:
-            agent.logger.info(f"\n🚀 Posting reply: '{reply_text}'")
-            agent.connection_manager.perform_action(
-                connection_name="twitter",
-                action_name="reply-to-tweet",
-                params=[tweet_id, reply_text]
-            )
-            agent.logger.info("✅ Reply posted successfully!")
-            return True
+    if reply_text:
+        agent.logger.info("\n🚀 Posting reply: '%s'", reply_text)
+        agent.connection_manager.perform_action(
+            connection_name="twitter",
+            action_name="reply-to-tweet",
+            params=[tweet_id, reply_text]
+        )
+        agent._timeline_cache = None  # our own reply changes the timeline
+        agent.logger.info("✅ Reply posted successfully!")
+        return True
+    return False
+
+@register_action("reply-to-tweet")
+def reply_to_tweet(agent, **kwargs):
+    timeline = agent.state.get("timeline_tweets")
+    if timeline:
+        return _reply_to_one(agent, timeline.popleft())
     else:
         agent.logger.info("\n👀 No tweets found to reply to...")
         return False
 
+@register_action("reply-to-tweets")
+def reply_to_tweets(agent, **kwargs):
+    """Reply to a batch of timeline tweets, overlapping LLM and API latency
+    across a bounded worker pool instead of one tweet per loop iteration.
+    """
+    timeline = agent.state.get("timeline_tweets")
+    if not timeline:
+        agent.logger.info("\n👀 No tweets found to reply to...")
+        return False
+
+    batch = [timeline.popleft() for _ in range(min(TWEET_BATCH_SIZE, len(timeline)))]
+    with ThreadPoolExecutor(max_workers=TWEET_BATCH_SIZE) as executor:
+        results = list(executor.map(lambda tweet: _reply_to_one(agent, tweet), batch))
+    return any(results)
+
 @register_action("like-tweet")
 def like_tweet(agent, **kwargs):
-    if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
-        tweet = agent.state["timeline_tweets"].pop(0)
+    timeline = agent.state.get("timeline_tweets")
+    if timeline:
+        tweet = timeline.popleft()
         tweet_id = tweet.get('id')
         if not tweet_id:
             return False
-        
-        is_own_tweet = tweet.get('author_username', '').lower() == agent.username
-        if is_own_tweet:
-            replies = agent.connection_manager.perform_action(
-                connection_name="twitter",
-                action_name="get-tweet-replies",
-                params=[tweet.get('author_id')]
-            )
-            if replies:
-                agent.state["timeline_tweets"].extend(replies[:agent.own_tweet_replies_count])
-            return True 
 
-        agent.logger.info(f"\n👍 LIKING TWEET: {tweet.get('text', '')[:50]}...")
+        # Own tweets are partitioned out (and their replies pulled in) when
+        # the timeline page is fetched, so everything here is likeable
+        agent.logger.info("\n👍 LIKING TWEET: %s...", tweet.get('text', '')[:50])
 
         agent.connection_manager.perform_action(
             connection_name="twitter",
@@ -108,7 +122,7 @@ def respond_to_mentions(agent,**kwargs): #REQUIRES TWITTER PREMIUM PLAN
         for tweet_data in stream_function:
             tweet_id = tweet_data["id"]
             tweet_text = tweet_data["text"]
-            agent.logger.info(f"Received a mention: {tweet_text}")
+            agent.logger.info("Received a mention: %s", tweet_text)
 
     processing_thread = threading.Thread(target=process_tweets)
     processing_thread.daemon = True
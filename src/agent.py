@@ -1,34 +1,105 @@
-import json
+import asyncio
+import bisect
+import functools
+import itertools
+import orjson
+import pickle
 import random
+import sys
+import threading
 import time
 import logging
 import os
+from collections import OrderedDict, deque
 from pathlib import Path
-from dotenv import load_dotenv
-from src.connection_manager import ConnectionManager
 from src.helpers import print_h_bar
 from src.action_handler import execute_action
-import src.actions.twitter_actions  
-import src.actions.echochamber_actions
-import src.actions.solana_actions
+from src.prompts import POST_TWEET_PROMPT
 from datetime import datetime
 
-REQUIRED_FIELDS = ["name", "bio", "traits", "examples", "loop_delay", "config", "tasks"]
+REQUIRED_FIELDS = frozenset({"name", "bio", "traits", "examples", "loop_delay", "config", "tasks"})
+
+# Cap on cached (prompt, system prompt) -> response pairs (oldest evicted first)
+LLM_CACHE_MAX = 512
+
+# Room topic/tags drift over hours, so one fetch per 5 minutes is plenty
+ROOM_INFO_TTL = 300
 
 logger = logging.getLogger("agent")
 
+_DOTENV_LOADED = False
+
+def _ensure_dotenv():
+    """Parse .env at most once per process; re-setup pays no disk I/O"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+# Parsed agent dicts persisted across CLI invocations (keyed by mtime)
+_AGENT_CACHE_DIR = Path.home() / '.zerepy' / 'agent_cache'
+
+@functools.lru_cache(maxsize=32)
+def _load_agent_dict(path: str, mtime: float) -> dict:
+    """Parse an agent JSON file; mtime keys the cache so edits invalidate.
+
+    A pickle of the parsed dict is kept under ~/.zerepy/agent_cache so
+    repeated CLI invocations skip the JSON parse entirely; any cache
+    problem silently falls back to parsing.
+    """
+    stem = Path(path).stem
+    cache_path = _AGENT_CACHE_DIR / f"{stem}.{int(mtime * 1e9)}.pkl"
+    if cache_path.exists():
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except Exception:
+            pass
+
+    agent_dict = orjson.loads(Path(path).read_bytes())
+    try:
+        _AGENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _AGENT_CACHE_DIR.glob(f"{stem}.*.pkl"):
+            stale.unlink(missing_ok=True)
+        cache_path.write_bytes(pickle.dumps(agent_dict, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return agent_dict
+
 class ZerePyAgent:
+    __slots__ = (
+        "name", "bio", "traits", "examples", "example_accounts",
+        "loop_delay", "connection_manager", "use_time_based_weights",
+        "time_based_multipliers", "tweet_interval", "own_tweet_replies_count",
+        "echochambers_message_interval", "echochambers_history_count",
+        "is_llm_set", "model_provider", "username", "_system_prompt",
+        "tasks", "task_weights", "_has_tweet_tasks", "_has_echochambers_tasks",
+        "logger", "state", "_shutdown", "_work",
+        "_timeline_task", "_timeline_cache", "timeline_cache_ttl",
+        "_task_pick_buffer", "_cum_weights", "_generate_text",
+        "_llm_cache", "_llm_cache_lock", "llm_cache_hits", "post_tweet_prompt",
+    )
+
     def __init__(
             self,
             agent_name: str
     ):
         try:
+            # Imported here so merely importing this module (e.g. to list
+            # agents) doesn't pull in every connection SDK or pay for the
+            # action-registry modules
+            from src.connection_manager import ConnectionManager
+            import src.actions.twitter_actions  # noqa: F401 (registers actions)
+            import src.actions.echochamber_actions  # noqa: F401
+            import src.actions.solana_actions  # noqa: F401
+            import src.actions.sonic_actions  # noqa: F401
+
             agent_path = Path("agents") / f"{agent_name}.json"
-            agent_dict = json.load(open(agent_path, "r"))
+            agent_dict = _load_agent_dict(str(agent_path), os.path.getmtime(agent_path))
 
-            missing_fields = [field for field in REQUIRED_FIELDS if field not in agent_dict]
+            missing_fields = REQUIRED_FIELDS - agent_dict.keys()
             if missing_fields:
-                raise KeyError(f"Missing required fields: {', '.join(missing_fields)}")
+                raise KeyError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
             self.name = agent_dict["name"]
             self.bio = agent_dict["bio"]
@@ -40,16 +111,26 @@ class ZerePyAgent:
             self.use_time_based_weights = agent_dict["use_time_based_weights"]
             self.time_based_multipliers = agent_dict["time_based_multipliers"]
 
-            has_twitter_tasks = any("tweet" in task["name"] for task in agent_dict.get("tasks", []))
-            
-            twitter_config = next((config for config in agent_dict["config"] if config["name"] == "twitter"), None)
-            
-            if has_twitter_tasks and twitter_config:
+            # Defaults for config-dependent fields so the loop and actions
+            # can never hit AttributeError when a section is missing
+            self.tweet_interval = 900
+            self.own_tweet_replies_count = 2
+            self.echochambers_message_interval = 60
+            self.echochambers_history_count = 50
+            self.model_provider = None
+            self.username = ""
+            self._generate_text = None
+
+            # Index configs by name once instead of a linear scan per lookup
+            config_by_name = {config["name"]: config for config in agent_dict["config"]}
+
+            twitter_config = config_by_name.get("twitter")
+            if any("tweet" in task["name"] for task in agent_dict.get("tasks", [])) and twitter_config:
                 self.tweet_interval = twitter_config.get("tweet_interval", 900)
                 self.own_tweet_replies_count = twitter_config.get("own_tweet_replies_count", 2)
 
             # Extract Echochambers config
-            echochambers_config = next((config for config in agent_dict["config"] if config["name"] == "echochambers"), None)
+            echochambers_config = config_by_name.get("echochambers")
             if echochambers_config:
                 self.echochambers_message_interval = echochambers_config.get("message_interval", 60)
                 self.echochambers_history_count = echochambers_config.get("history_read_count", 50)
@@ -59,14 +140,51 @@ class ZerePyAgent:
             # Cache for system prompt
             self._system_prompt = None
 
-            # Extract loop tasks
-            self.tasks = agent_dict.get("tasks", [])
-            self.task_weights = [task.get("weight", 0) for task in self.tasks]
+            # Extract loop tasks (tuples: immutable, read every iteration)
+            self.tasks = tuple(agent_dict.get("tasks", []))
+            self.task_weights = tuple(task.get("weight", 0) for task in self.tasks)
+            # Cumulative weights let random.choices skip re-summing the
+            # static weights on every draw
+            self._cum_weights = tuple(itertools.accumulate(self.task_weights))
+
+            # Task-category flags, computed once so the loop doesn't rescan
+            # task names every tick
+            self._has_tweet_tasks = any("tweet" in task["name"] for task in self.tasks)
+            self._has_echochambers_tasks = any("echochambers" in task["name"] for task in self.tasks)
             self.logger = logging.getLogger("agent")
 
+            # The agent name never changes, so resolve it into the tweet
+            # template once instead of re-formatting per post
+            self.post_tweet_prompt = POST_TWEET_PROMPT.format(agent_name=self.name)
+
             # Set up empty agent state
             self.state = {}
 
+            # Wake signal: set when background work (e.g. a timeline
+            # prefetch) completes, so the loop doesn't idle through it
+            self._work = asyncio.Event()
+
+            # In-flight background timeline fetch, if any
+            self._timeline_task = None
+
+            # Monotonic time of the last timeline fetch; refetches are
+            # throttled for the TTL to spare rate-limited Twitter reads.
+            # Posting actions reset it to None to allow a fresh read.
+            self._timeline_cache = None
+            self.timeline_cache_ttl = 60
+
+            # Prefilled weighted task picks (only valid for static weights)
+            self._task_pick_buffer = []
+
+            # Response cache for reply prompts: identical (prompt, system
+            # prompt) pairs skip the LLM round-trip entirely. Exact-match
+            # only, so generation tasks that want variety must not opt in.
+            self._llm_cache = OrderedDict()
+            # Batched reply actions call prompt_llm from worker threads,
+            # so cache mutations must be serialized
+            self._llm_cache_lock = threading.Lock()
+            self.llm_cache_hits = 0
+
         except Exception as e:
             logger.error("Could not load ZerePy agent")
             raise e
@@ -78,9 +196,17 @@ class ZerePyAgent:
             raise ValueError("No configured LLM provider found")
         self.model_provider = llm_providers[0]
 
+        # Pre-resolve the generate-text call chain so prompt_llm skips the
+        # per-call connection/action lookups
+        self._generate_text = functools.partial(
+            self.connection_manager.perform_action,
+            connection_name=self.model_provider,
+            action_name="generate-text"
+        )
+
         # Load Twitter username for self-reply detection if Twitter tasks exist
-        if any("tweet" in task["name"] for task in self.tasks):
-            load_dotenv()
+        if self._has_tweet_tasks:
+            _ensure_dotenv()
             self.username = os.getenv('TWITTER_USERNAME', '').lower()
             if not self.username:
                 logger.warning("Twitter username not found, some Twitter functionalities may be limited")
@@ -110,12 +236,14 @@ class ZerePyAgent:
                         if tweets:
                             prompt_parts.extend(f"- {tweet['text']}" for tweet in tweets)
 
-            self._system_prompt = "\n".join(prompt_parts)
+            # Interned so downstream dict lookups keyed on the prompt can
+            # compare by identity
+            self._system_prompt = sys.intern("\n".join(prompt_parts))
 
         return self._system_prompt
     
-    def _adjust_weights_for_time(self, current_hour: int, task_weights: list) -> list:
-        weights = task_weights.copy()
+    def _adjust_weights_for_time(self, current_hour: int, task_weights) -> list:
+        weights = list(task_weights)
         
         # Reduce tweet frequency during night hours (1 AM - 5 AM)
         if 1 <= current_hour <= 5:
@@ -135,85 +263,251 @@ class ZerePyAgent:
         
         return weights
 
-    def prompt_llm(self, prompt: str, system_prompt: str = None) -> str:
-        """Generate text using the configured LLM provider"""
-        system_prompt = system_prompt or self._construct_system_prompt()
-
-        return self.connection_manager.perform_action(
-            connection_name=self.model_provider,
-            action_name="generate-text",
-            params=[prompt, system_prompt]
+    def prompt_llm(self, prompt: str, system_prompt: str = None, use_cache: bool = False) -> str:
+        """Generate text using the configured LLM provider.
+
+        With use_cache=True, an identical (prompt, system_prompt) pair
+        returns the previous response instead of re-generating — only
+        suitable for reply-style prompts where the input fully determines
+        the desired output.
+        """
+        # The prompt is materialized before the loop starts, so this is a
+        # plain attribute read on the hot path; the build only runs for
+        # one-off calls before warmup
+        system_prompt = system_prompt or self._system_prompt or self._construct_system_prompt()
+
+        if use_cache:
+            key = (prompt, system_prompt)
+            with self._llm_cache_lock:
+                cached = self._llm_cache.get(key)
+                if cached is not None:
+                    self._llm_cache.move_to_end(key)
+                    self.llm_cache_hits += 1
+                    logger.debug("LLM cache hit (%d total)", self.llm_cache_hits)
+                    return cached
+            response = self._generate_text(params=[prompt, system_prompt])
+            if response:
+                with self._llm_cache_lock:
+                    self._llm_cache[key] = response
+                    if len(self._llm_cache) > LLM_CACHE_MAX:
+                        self._llm_cache.popitem(last=False)
+            return response
+
+        return self._generate_text(params=[prompt, system_prompt])
+
+    def _expand_own_tweets(self, tweets: list) -> list:
+        """Swap our own tweets for replies to them, in one pass at fetch time.
+
+        Doing the ownership split and reply fetches here (once per
+        timeline page, off the hot loop) means the per-tick actions only
+        ever see ready reply/like candidates.
+        """
+        if not self.username:
+            return list(tweets)
+
+        own, others = [], []
+        for tweet in tweets:
+            (own if tweet.get('author_username', '').lower() == self.username else others).append(tweet)
+
+        for tweet in own:
+            replies = self.connection_manager.perform_action(
+                connection_name="twitter",
+                action_name="get-tweet-replies",
+                params=[tweet.get('author_id')]
+            )
+            if replies:
+                others.extend(replies[:self.own_tweet_replies_count])
+        return others
+
+    def _timeline_throttled(self):
+        """True while the last timeline fetch is within the TTL"""
+        return (self._timeline_cache is not None
+                and time.monotonic() - self._timeline_cache < self.timeline_cache_ttl)
+
+    def _read_timeline(self):
+        # Each fetched page is handed to the loop exactly once — consumers
+        # pop tweets and act on them, so re-serving a cached page would
+        # replay likes/replies on tweets already processed. The cache is
+        # therefore just the last fetch time, throttling refetches while
+        # the TTL holds.
+        if self._timeline_throttled():
+            return []
+
+        tweets = self.connection_manager.perform_action(
+            connection_name="twitter",
+            action_name="read-timeline",
+            params=[]
         )
+        if tweets:
+            tweets = self._expand_own_tweets(tweets)
+            self._timeline_cache = time.monotonic()
+        return tweets
+
+    async def _get_timeline_page(self):
+        """Return the next timeline page, consuming the prefetch if one is in flight"""
+        if self._timeline_task is not None:
+            task, self._timeline_task = self._timeline_task, None
+            return await task
+        return await asyncio.to_thread(self._read_timeline)
+
+    def _on_timeline_prefetch(self, task):
+        # Wake the sleeping loop only when the prefetch actually produced
+        # tweets; an empty page (e.g. the TTL throttle) carries no work,
+        # and waking on it would spin the loop through its sleep
+        if not task.cancelled() and task.exception() is None and task.result():
+            self._work.set()
 
     def perform_action(self, connection: str, action: str, **kwargs) -> None:
         return self.connection_manager.perform_action(connection, action, **kwargs)
     
     def select_action(self, use_time_based_weights: bool = False) -> dict:
-        task_weights = [weight for weight in self.task_weights.copy()]
-        
         if use_time_based_weights:
+            # Weights shift with the hour, so draw fresh each time; a
+            # direct bisect over the running totals skips the list
+            # machinery random.choices builds for a single sample
             current_hour = datetime.now().hour
-            task_weights = self._adjust_weights_for_time(current_hour, task_weights)
-        
-        return random.choices(self.tasks, weights=task_weights, k=1)[0]
+            task_weights = self._adjust_weights_for_time(current_hour, self.task_weights)
+            cum_weights = list(itertools.accumulate(task_weights))
+            idx = bisect.bisect(cum_weights, random.random() * cum_weights[-1])
+            return self.tasks[idx]
+
+        # Static weights: refill a batch of picks in one C-level call and
+        # consume them one per iteration
+        if not self._task_pick_buffer:
+            self._task_pick_buffer = random.choices(self.tasks, cum_weights=self._cum_weights, k=32)
+        return self._task_pick_buffer.pop()
 
     def loop(self):
-        """Main agent loop for autonomous behavior"""
+        """Main agent loop for autonomous behavior (sync entry point)"""
+        try:
+            asyncio.run(self._loop())
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Agent loop stopped by user.")
+
+    def _next_delay(self, success: bool) -> float:
+        """Delay before the next iteration, shortened when a posting window opens sooner.
+
+        Only windows still in the future shorten the delay; an overdue
+        window must not clamp the whole loop below loop_delay, or every
+        non-posting tick would spin at the floor until the weighted draw
+        happens to pick the posting task.
+        """
+        if not success:
+            return 60
+        delay = self.loop_delay
+        now = time.time()
+        if self._has_tweet_tasks and "last_tweet_time" in self.state:
+            remaining = self.tweet_interval - (now - self.state["last_tweet_time"])
+            if remaining > 0:
+                delay = min(delay, remaining)
+        if self._has_echochambers_tasks and "echochambers_last_message" in self.state:
+            remaining = self.echochambers_message_interval - (now - self.state["echochambers_last_message"])
+            if remaining > 0:
+                delay = min(delay, remaining)
+        return max(delay, 1.0)
+
+    async def _sleep_or_shutdown(self, delay: float) -> None:
+        """Sleep up to delay seconds, waking early on shutdown or new work"""
+        waiters = (
+            asyncio.create_task(self._shutdown.wait()),
+            asyncio.create_task(self._work.wait()),
+        )
+        _, pending = await asyncio.wait(waiters, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        self._work.clear()
+
+    async def _loop(self, shutdown: asyncio.Event = None):
+        """Async agent loop; sleeps yield the event loop instead of blocking.
+
+        Pass a shutdown event to stop the loop gracefully from another
+        task (shutdown.set()) rather than via KeyboardInterrupt.
+        """
+        self._shutdown = shutdown if shutdown is not None else asyncio.Event()
         if not self.is_llm_set:
             self._setup_llm_provider()
 
+        # Materialize the system prompt up front (it can hit the Twitter
+        # connection for example accounts); prompt_llm reuses the cache
+        self._construct_system_prompt()
+
         logger.info("\n🚀 Starting agent loop...")
         logger.info("Press Ctrl+C at any time to stop the loop.")
         print_h_bar()
 
-        time.sleep(2)
-        logger.info("Starting loop in 5 seconds...")
-        for i in range(5, 0, -1):
-            logger.info(f"{i}...")
-            time.sleep(1)
-
-        try:
-            while True:
-                success = False
-                try:
-                    # REPLENISH INPUTS
-                    # TODO: Add more inputs to complexify agent behavior
-                    if "timeline_tweets" not in self.state or self.state["timeline_tweets"] is None or len(self.state["timeline_tweets"]) == 0:
-                        if any("tweet" in task["name"] for task in self.tasks):
-                            logger.info("\n👀 READING TIMELINE")
-                            self.state["timeline_tweets"] = self.connection_manager.perform_action(
-                                connection_name="twitter",
-                                action_name="read-timeline",
-                                params=[]
-                            )
-
-                    if "room_info" not in self.state or self.state["room_info"] is None:
-                        if any("echochambers" in task["name"] for task in self.tasks):
-                            logger.info("\n👀 READING ECHOCHAMBERS ROOM INFO")
-                            self.state["room_info"] = self.connection_manager.perform_action(
-                                connection_name="echochambers",
-                                action_name="get-room-info",
-                                params={}
-                            )
-
-                    # CHOOSE AN ACTION
-                    # TODO: Add agentic action selection
-                    
-                    action = self.select_action(use_time_based_weights=self.use_time_based_weights)
-                    action_name = action["name"]
-
-                    # PERFORM ACTION
-                    success = execute_action(self, action_name)
-
-                    logger.info(f"\n⏳ Waiting {self.loop_delay} seconds before next loop...")
-                    print_h_bar()
-                    time.sleep(self.loop_delay if success else 60)
-
-                except Exception as e:
-                    logger.error(f"\n❌ Error in agent loop iteration: {e}")
-                    logger.info(f"⏳ Waiting {self.loop_delay} seconds before retrying...")
-                    time.sleep(self.loop_delay)
-
-        except KeyboardInterrupt:
-            logger.info("\n🛑 Agent loop stopped by user.")
-            return
\ No newline at end of file
+        # Hoist hot lookups out of the loop
+        state = self.state
+        perform_action = self.connection_manager.perform_action
+        select_action = self.select_action
+        sleep_or_shutdown = self._sleep_or_shutdown
+        log_info = logger.info
+        h_bar = print_h_bar
+
+        while not self._shutdown.is_set():
+            success = False
+            tick_start = time.monotonic()
+            try:
+                # REPLENISH INPUTS
+                # TODO: Add more inputs to complexify agent behavior
+                # The two fetches are independent, so schedule both before
+                # awaiting either and let the network waits overlap
+                timeline_fut = None
+                room_fut = None
+
+                # One dict get; falsiness covers missing, None and empty
+                if self._has_tweet_tasks and not state.get("timeline_tweets"):
+                    log_info("\n👀 READING TIMELINE")
+                    timeline_fut = asyncio.ensure_future(self._get_timeline_page())
+
+                if self._has_echochambers_tasks:
+                    # Refresh room info on a TTL rather than holding the
+                    # first fetch forever (or re-fetching every tick)
+                    if (state.get("room_info") is None
+                            or time.monotonic() - state.get("room_info_fetched_at", 0) > ROOM_INFO_TTL):
+                        log_info("\n👀 READING ECHOCHAMBERS ROOM INFO")
+                        room_fut = asyncio.ensure_future(asyncio.to_thread(
+                            perform_action,
+                            connection_name="echochambers",
+                            action_name="get-room-info",
+                            params={}
+                        ))
+
+                if timeline_fut is not None:
+                    timeline_tweets = await timeline_fut
+                    # deque gives O(1) popleft for the tweet actions
+                    state["timeline_tweets"] = deque(timeline_tweets) if timeline_tweets is not None else None
+
+                if room_fut is not None:
+                    state["room_info"] = await room_fut
+                    state["room_info_fetched_at"] = time.monotonic()
+
+                # CHOOSE AN ACTION
+                # TODO: Add agentic action selection
+
+                task = select_action(use_time_based_weights=self.use_time_based_weights)
+                action_name = task["name"]
+
+                # PERFORM ACTION
+                success = execute_action(self, action_name)
+
+                # Kick off the next page fetch while we idle so the
+                # network wait overlaps with the coming iteration's work.
+                # Skip it while the TTL throttle holds — the fetch would
+                # return an empty page immediately and just churn the loop
+                timeline = state.get("timeline_tweets")
+                if (self._timeline_task is None and timeline is not None and len(timeline) <= 1
+                        and self._has_tweet_tasks and not self._timeline_throttled()):
+                    self._timeline_task = asyncio.create_task(asyncio.to_thread(self._read_timeline))
+                    self._timeline_task.add_done_callback(self._on_timeline_prefetch)
+
+                # Count time already spent in this tick against the delay,
+                # so slow actions don't stack a full sleep on top
+                delay = max(self._next_delay(success) - (time.monotonic() - tick_start), 0.0)
+                log_info("\n⏳ Waiting %s seconds before next loop...", round(delay, 1))
+                h_bar()
+                await sleep_or_shutdown(delay)
+
+            except Exception as e:
+                logger.error("\n❌ Error in agent loop iteration: %s", e)
+                log_info("⏳ Waiting %s seconds before retrying...", self.loop_delay)
+                await sleep_or_shutdown(self.loop_delay)
\ No newline at end of file
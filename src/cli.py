@@ -1,35 +1,83 @@
 import sys
-import json
+import functools
+import heapq
+import itertools
 import logging
 import os
 import shlex
-from dataclasses import dataclass
 from typing import Callable, Dict, List
 from pathlib import Path
+import orjson
 from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.styles import Style
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import FileHistory
-from src.agent import ZerePyAgent
 from src.helpers import print_h_bar
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger("cli")
 
-@dataclass
 class Command:
-    """Dataclass to represent a CLI command"""
-    name: str
-    description: str
-    tips: List[str]
-    handler: Callable
-    aliases: List[str] = None
+    """Represents a CLI command (slotted: no per-instance __dict__)"""
+    __slots__ = ('name', 'description', 'tips', 'handler', 'aliases')
+
+    def __init__(self, name: str, description: str, tips: List[str],
+                 handler: Callable, aliases: List[str] = None):
+        self.name = name
+        self.description = description
+        self.tips = tips
+        self.handler = handler
+        self.aliases = tuple(aliases) if aliases else ()
+
+def requires_agent(fn):
+    """Guard a command handler behind a loaded agent (one shared check)"""
+    @functools.wraps(fn)
+    def wrapper(self, input_list):
+        if self.agent is None:
+            logger.info("No agent is currently loaded. Use 'load-agent' to load an agent.")
+            return
+        return fn(self, input_list)
+    return wrapper
+
+
+class BoundedFileHistory(FileHistory):
+    """FileHistory that only surfaces the most recent entries.
+
+    The file still accumulates everything, but prompt navigation and
+    completion only walk a bounded window instead of the whole history
+    of a long-lived install.
+    """
+
+    def __init__(self, filename: str, max_entries: int = 500):
+        self.max_entries = max_entries
+        super().__init__(filename)
+
+    def load_history_strings(self):
+        return itertools.islice(super().load_history_strings(), self.max_entries)
+
+
+class CommandCompleter(Completer):
+    """Completer backed by a prefix index built once at startup.
+
+    Each keystroke becomes a single dict lookup instead of the linear
+    scan over every command name that WordCompleter does.
+    """
+
+    def __init__(self, command_names):
+        self._all = sorted(command_names)
+        self._prefix_map: Dict[str, List[str]] = {}
+        for name in self._all:
+            for i in range(1, len(name) + 1):
+                self._prefix_map.setdefault(name[:i], []).append(name)
+
+    def get_completions(self, document, complete_event):
+        word = document.text_before_cursor.lstrip().lower()
+        matches = self._all if not word else self._prefix_map.get(word, ())
+        for name in matches:
+            yield Completion(name, start_position=-len(word))
 
-    def __post_init__(self):
-        if self.aliases is None:
-            self.aliases = []
 
 class ZerePyCLI:
     def __init__(self):
@@ -37,17 +85,34 @@ class ZerePyCLI:
         
         # Create config directory if it doesn't exist
         self.config_dir = Path.home() / '.zerepy'
-        self.config_dir.mkdir(exist_ok=True)
+        os.makedirs(self.config_dir, exist_ok=True)
         
         # Initialize command registry
         self._initialize_commands()
         
+        # Agents listing memoized on the directory's mtime
+        self._agents_cache = (None, ())
+
+        # Constructed agents memoized by name, keyed on file mtime, so
+        # re-loading the same agent mid-session is free
+        self._agent_instances = {}
+
+        # Prompt HTML memoized on the loaded agent's identity; rebuilding
+        # it per redraw re-parses the markup every keystroke
+        self._prompt_cache = (False, None)
+
         # Setup prompt toolkit components
         self._setup_prompt_toolkit()
 
     def _initialize_commands(self) -> None:
         """Initialize all CLI commands"""
         self.commands: Dict[str, Command] = {}
+        # Hot dispatch table: name/alias -> bound handler, so executing a
+        # command is one dict probe with the callable as payload; the
+        # Command objects stay as the cold metadata side for help output
+        self._handlers: Dict[str, Callable] = {}
+        # Primary commands only (no alias entries), for help listings
+        self._primary_commands: List[Command] = []
         
         # Help command
         self._register_command(
@@ -202,6 +267,9 @@ class ZerePyCLI:
             )
         )
 
+        # Character-bigram sets per command, built once for typo suggestions
+        self._cmd_bigrams = {name: set(zip(name, name[1:])) for name in self.commands}
+
     def _setup_prompt_toolkit(self) -> None:
         """Setup prompt toolkit components"""
         self.style = Style.from_dict({
@@ -212,19 +280,16 @@ class ZerePyCLI:
             'warning': 'ansiyellow',
         })
 
-        # Use FileHistory for persistent command history
-        history_file = self.config_dir / 'history.txt'
-        
-        self.completer = WordCompleter(
-            list(self.commands.keys()), 
-            ignore_case=True,
-            sentence=True
-        )
-        
-        self.session = PromptSession(
+        self.completer = CommandCompleter(self.commands.keys())
+
+    @functools.cached_property
+    def session(self) -> PromptSession:
+        """Prompt session, created on first prompt so commands that exit
+        immediately never pay for the persistent FileHistory setup"""
+        return PromptSession(
             completer=self.completer,
             style=self.style,
-            history=FileHistory(str(history_file))
+            history=BoundedFileHistory(str(self.config_dir / 'history.txt'))
         )
 
     ###################
@@ -232,29 +297,46 @@ class ZerePyCLI:
     ###################
     def _register_command(self, command: Command) -> None:
         """Register a command and its aliases"""
-        self.commands[command.name] = command
+        # Interned keys let dict probes hit the identity-compare fast path
+        name = sys.intern(command.name)
+        self.commands[name] = command
+        self._handlers[name] = command.handler
+        self._primary_commands.append(command)
         for alias in command.aliases:
+            alias = sys.intern(alias)
             self.commands[alias] = command
+            self._handlers[alias] = command.handler
 
     def _get_prompt_message(self) -> HTML:
         """Generate the prompt message based on current state"""
+        agent_id = id(self.agent) if self.agent else None
+        if agent_id == self._prompt_cache[0]:
+            return self._prompt_cache[1]
+
         agent_status = f"({self.agent.name})" if self.agent else "(no agent)"
-        return HTML(f'<prompt>ZerePy-CLI</prompt> {agent_status} > ')
+        message = HTML(f'<prompt>ZerePy-CLI</prompt> {agent_status} > ')
+        self._prompt_cache = (agent_id, message)
+        return message
 
     def _handle_command(self, input_string: str) -> None:
         """Parse and handle a command input"""
         try:
-            input_list = shlex.split(input_string)
+            # shlex is a slow pure-Python scanner; only pay for it when the
+            # input actually uses quoting or escapes
+            if "'" in input_string or '"' in input_string or "\\" in input_string:
+                input_list = shlex.split(input_string)
+            else:
+                input_list = input_string.split()
         except ValueError as e:
             logger.error(f"Error parsing command: {e}")
             return
 
-        command_string = input_list[0].lower()
+        command_string = sys.intern(input_list[0].lower())
 
         try:
-            command = self.commands.get(command_string)
-            if command:
-                command.handler(input_list)
+            handler = self._handlers.get(command_string)
+            if handler:
+                handler(input_list)
             else:
                 self._handle_unknown_command(command_string)
         except Exception as e:
@@ -273,9 +355,18 @@ class ZerePyCLI:
         logger.info("Use 'help' to see all available commands.")
 
     def _get_command_suggestions(self, command: str, max_suggestions: int = 3) -> List[str]:
-        """Get command suggestions based on string similarity"""
-        from difflib import get_close_matches
-        return get_close_matches(command, self.commands.keys(), n=max_suggestions, cutoff=0.6)
+        """Get command suggestions by Jaccard similarity on character bigrams"""
+        query = set(zip(command, command[1:]))
+        if not query:
+            # Too short for bigrams; fall back to a prefix match
+            return sorted(name for name in self._cmd_bigrams if name.startswith(command))[:max_suggestions]
+
+        scored = (
+            (len(query & bigrams) / len(query | bigrams), name)
+            for name, bigrams in self._cmd_bigrams.items()
+        )
+        best = heapq.nlargest(max_suggestions, (item for item in scored if item[0] >= 0.4))
+        return [name for _, name in best]
 
     def _print_welcome_message(self, clearing: bool = False) -> None:
         """Print welcome message and initial status
@@ -318,13 +409,11 @@ class ZerePyCLI:
         logger.info("\nAvailable Commands:")
         # Group commands by first letter for better organization
         commands_by_letter = {}
-        for cmd_name, cmd in self.commands.items():
-            # Only show main commands, not aliases
-            if cmd_name == cmd.name:
-                first_letter = cmd_name[0].upper()
-                if first_letter not in commands_by_letter:
-                    commands_by_letter[first_letter] = []
-                commands_by_letter[first_letter].append(cmd)
+        for cmd in self._primary_commands:
+            first_letter = cmd.name[0].upper()
+            if first_letter not in commands_by_letter:
+                commands_by_letter[first_letter] = []
+            commands_by_letter[first_letter].append(cmd)
 
         for letter in sorted(commands_by_letter.keys()):
             logger.info(f"\n{letter}:")
@@ -338,8 +427,20 @@ class ZerePyCLI:
             logger.info(f"\nNo default agent is loaded, please use the load-agent command to do that.")
 
     def _load_agent_from_file(self, agent_name):
-        try: 
-            self.agent = ZerePyAgent(agent_name)
+        # Deferred so the CLI shell comes up before the agent stack loads
+        from src.agent import ZerePyAgent
+        try:
+            # Accept 'name' and 'name.json' alike
+            if agent_name.endswith(".json"):
+                agent_name = agent_name[:-5]
+
+            mtime = os.path.getmtime(Path("agents") / f"{agent_name}.json")
+            cached = self._agent_instances.get(agent_name)
+            if cached is not None and cached[0] == mtime:
+                self.agent = cached[1]
+            else:
+                self.agent = ZerePyAgent(agent_name)
+                self._agent_instances[agent_name] = (mtime, self.agent)
             logger.info(f"\n✅ Successfully loaded agent: {self.agent.name}")
         except FileNotFoundError:
             logger.error(f"Agent file not found: {agent_name}")
@@ -352,10 +453,8 @@ class ZerePyCLI:
     def _load_default_agent(self) -> None:
         """Load users default agent"""
         agent_general_config_path = Path("agents") / "general.json"
-        file = None
         try:
-            file = open(agent_general_config_path, 'r')
-            data = json.load(file)
+            data = orjson.loads(agent_general_config_path.read_bytes())
             if not data.get('default_agent'):
                 logger.error('No default agent defined, please set one in general.json')
                 return
@@ -364,12 +463,9 @@ class ZerePyCLI:
         except FileNotFoundError:
             logger.error("File general.json not found, please create one.")
             return
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("File agents/general.json contains Invalid JSON format")
             return
-        finally:
-            if file:
-                file.close()
     
     ###################
     # Command functions
@@ -386,12 +482,9 @@ class ZerePyCLI:
         os.system('cls' if os.name == 'nt' else 'clear')
         self._print_welcome_message(clearing=True)
 
+    @requires_agent
     def agent_action(self, input_list: List[str]) -> None:
         """Handle agent action command"""
-        if self.agent is None:
-            logger.info("No agent is currently loaded. Use 'load-agent' to load an agent.")
-            return
-
         if len(input_list) < 3:
             logger.info("Please specify both a connection and an action.")
             logger.info("Format: agent-action {connection} {action}")
@@ -407,12 +500,9 @@ class ZerePyCLI:
         except Exception as e:
             logger.error(f"Error running action: {e}")
 
+    @requires_agent
     def agent_loop(self, input_list: List[str]) -> None:
         """Handle agent loop command"""
-        if self.agent is None:
-            logger.info("No agent is currently loaded. Use 'load-agent' to load an agent.")
-            return
-
         try:
             self.agent.loop()
         except KeyboardInterrupt:
@@ -423,20 +513,33 @@ class ZerePyCLI:
     def list_agents(self, input_list: List[str]) -> None:
         """Handle list agents command"""
         logger.info("\nAvailable Agents:")
-        agents_dir = Path("agents")
-        if not agents_dir.exists():
+        try:
+            # Re-list only when the directory changed; warm hits skip the
+            # scandir walk entirely
+            dir_mtime = os.stat("agents").st_mtime_ns
+            if dir_mtime == self._agents_cache[0]:
+                agents = self._agents_cache[1]
+            else:
+                # os.scandir avoids the per-entry Path objects and extra
+                # stat calls that Path.glob does
+                with os.scandir("agents") as entries:
+                    agents = tuple(sorted(
+                        entry.name[:-5] for entry in entries
+                        if entry.is_file(follow_symlinks=False) and entry.name.endswith(".json")
+                    ))
+                self._agents_cache = (dir_mtime, agents)
+        except FileNotFoundError:
             logger.info("No agents directory found.")
             return
 
-        agents = list(agents_dir.glob("*.json"))
         if not agents:
             logger.info("No agents found. Use 'create-agent' to create a new agent.")
             return
 
-        for agent_file in sorted(agents):
-            if agent_file.stem == "general":
+        for agent_name in agents:
+            if agent_name == "general":
                 continue
-            logger.info(f"- {agent_file.stem}")
+            logger.info(f"- {agent_name}")
 
     def load_agent(self, input_list: List[str]) -> None:
         """Handle load agent command"""
@@ -460,33 +563,26 @@ class ZerePyCLI:
             return
         
         agent_general_config_path = Path("agents") / "general.json"
-        file = None
         try:
-            file = open(agent_general_config_path, 'r')
-            data = json.load(file)
+            data = orjson.loads(agent_general_config_path.read_bytes())
             agent_file_name = input_list[1]
             # if file does not exist, refuse to set it as default
-            try:
-                agent_path = Path("agents") / f"{agent_file_name}.json"
-                open(agent_path, 'r')
-            except FileNotFoundError:
+            agent_path = Path("agents") / f"{agent_file_name}.json"
+            if not agent_path.exists():
                 logging.error("Agent file not found.")
                 return
-            
+
             data['default_agent'] = input_list[1]
-            with open(agent_general_config_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            agent_general_config_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.info(f"Agent {agent_file_name} is now set as default.")
         except FileNotFoundError:
             logger.error("File not found")
             return
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON format")
             return
-        finally:
-            if file:
-                file.close()
 
+    @requires_agent
     def list_actions(self, input_list: List[str]) -> None:
         """Handle list actions command"""
         if len(input_list) < 2:
@@ -497,6 +593,7 @@ class ZerePyCLI:
 
         self.agent.connection_manager.list_actions(connection_name=input_list[1])
 
+    @requires_agent
     def configure_connection(self, input_list: List[str]) -> None:
         """Handle configure connection command"""
         if len(input_list) < 2:
@@ -514,12 +611,9 @@ class ZerePyCLI:
         else:
             logging.info("Please load an agent to see the list of supported actions")
 
+    @requires_agent
     def chat_session(self, input_list: List[str]) -> None:
         """Handle chat command"""
-        if self.agent is None:
-            logger.info("No agent loaded. Use 'load-agent' first.")
-            return
-
         if not self.agent.is_llm_set:
             self.agent._setup_llm_provider()
 
@@ -558,9 +652,10 @@ class ZerePyCLI:
         # Start CLI loop
         while True:
             try:
+                # The session already carries the style; passing it again
+                # forces a style merge on every prompt
                 input_string = self.session.prompt(
-                    self._get_prompt_message(),
-                    style=self.style
+                    self._get_prompt_message()
                 ).strip()
 
                 if not input_string:
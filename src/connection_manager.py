@@ -29,6 +29,9 @@ logger = logging.getLogger("connection_manager")
 class ConnectionManager:
     def __init__(self, agent_config):
         self.connections: Dict[str, BaseConnection] = {}
+        # Connections whose is_configured() already passed; some checks hit
+        # the network, so hot dispatch must not repeat them per action
+        self._configured: set = set()
         for config in agent_config:
             self._register_connection(config)
 
@@ -118,6 +121,7 @@ class ConnectionManager:
                 logging.info(
                     f"\n✅ SUCCESSFULLY CONFIGURED CONNECTION: {connection_name}"
                 )
+                self._configured.discard(connection_name)  # re-validate on next use
             else:
                 logging.error(f"\n❌ ERROR CONFIGURING CONNECTION: {connection_name}")
             return success
@@ -133,12 +137,14 @@ class ConnectionManager:
 
     def list_connections(self) -> None:
         """List all available connections and their status"""
-        logging.info("\nAVAILABLE CONNECTIONS:")
+        # One buffered emit instead of a handler lock + write per line
+        lines = ["\nAVAILABLE CONNECTIONS:"]
         for name, connection in self.connections.items():
             status = (
                 "✅ Configured" if connection.is_configured() else "❌ Not Configured"
             )
-            logging.info(f"- {name}: {status}")
+            lines.append(f"- {name}: {status}")
+        logging.info("\n".join(lines))
 
     def list_actions(self, connection_name: str) -> None:
         """List all available actions for a specific connection"""
@@ -176,11 +182,15 @@ class ConnectionManager:
         try:
             connection = self.connections[connection_name]
 
-            if not connection.is_configured():
-                logging.error(
-                    f"\nError: Connection '{connection_name}' is not configured"
-                )
-                return None
+            # First use pays the (possibly networked) configuration check;
+            # subsequent calls on the same connection skip it
+            if connection_name not in self._configured:
+                if not connection.is_configured():
+                    logging.error(
+                        f"\nError: Connection '{connection_name}' is not configured"
+                    )
+                    return None
+                self._configured.add(connection_name)
 
             if action_name not in connection.actions:
                 logging.error(
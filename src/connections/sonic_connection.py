@@ -4,6 +4,7 @@ import requests
 import time
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv, set_key
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 from src.constants.abi import ERC20_ABI
@@ -22,6 +23,8 @@ class SonicConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Sonic connection...")
         self._web3 = None
+        # Assume the node offers the synchronous broadcast RPC until proven otherwise
+        self._sync_send_supported = True
         
         # Get network configuration
         network = config.get("network", "mainnet")
@@ -218,6 +221,28 @@ class SonicConnection(BaseConnection):
             logger.error(f"Failed to get balance: {e}")
             raise
 
+    def _send_raw_transaction(self, raw_transaction) -> HexBytes:
+        """Broadcast a signed transaction, preferring eth_sendRawTransactionSync
+        (returns once the tx is confirmed) where the node supports it."""
+        if self._sync_send_supported:
+            try:
+                result = self._web3.manager.request_blocking(
+                    "eth_sendRawTransactionSync", [Web3.to_hex(raw_transaction)]
+                )
+                # EIP-7966 nodes return the full transaction receipt;
+                # others echo back the hash
+                if isinstance(result, dict):
+                    return HexBytes(result["transactionHash"])
+                return HexBytes(result)
+            except Exception as e:
+                message = str(e).lower()
+                if "method not found" in message or "not supported" in message or "-32601" in message:
+                    logger.debug(f"eth_sendRawTransactionSync unavailable, using legacy broadcast: {e}")
+                    self._sync_send_supported = False
+                else:
+                    raise
+        return self._web3.eth.send_raw_transaction(raw_transaction)
+
     def transfer(self, to_address: str, amount: float, token_address: Optional[str] = None) -> str:
         """Transfer $S or tokens to an address"""
         try:
@@ -253,7 +278,7 @@ class SonicConnection(BaseConnection):
                 }
 
             signed = account.sign_transaction(tx)
-            tx_hash = self._web3.eth.send_raw_transaction(signed.rawTransaction)
+            tx_hash = self._send_raw_transaction(signed.rawTransaction)
 
             # Log and return explorer link immediately
             tx_link = self._get_explorer_link(tx_hash.hex())
@@ -362,7 +387,7 @@ class SonicConnection(BaseConnection):
                 })
                 
                 signed_approve = account.sign_transaction(approve_tx)
-                tx_hash = self._web3.eth.send_raw_transaction(signed_approve.rawTransaction)
+                tx_hash = self._send_raw_transaction(signed_approve.rawTransaction)
                 logger.info(f"Approval transaction sent: {self._get_explorer_link(tx_hash.hex())}")
                 
                 # Wait for approval to be mined
@@ -429,7 +454,7 @@ class SonicConnection(BaseConnection):
             
             # Sign and send transaction
             signed_tx = account.sign_transaction(tx)
-            tx_hash = self._web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            tx_hash = self._send_raw_transaction(signed_tx.rawTransaction)
             
             # Log and return explorer link immediately
             tx_link = self._get_explorer_link(tx_hash.hex())